@@ -6,8 +6,8 @@ Reference
 ---------
 
 '''
-import re
 import os
+import shlex
 import tempfile
 import collections
 import shutil
@@ -15,6 +15,14 @@ import cgatcore.experiment as E
 from cgatcore import pipeline as P
 import sqlite3
 
+# awk program that prefixes annotator2tsv output with the subset,
+# workspace and slice columns. The values are read from ENVIRON so
+# that they are output verbatim without awk's escape processing.
+ANNOTATOR_AWK = (
+    '/^id/ {sub(/^id/, "track"); '
+    'print "subset", "workspace", "slice", $0; next} '
+    '{print ENVIRON["subset"], ENVIRON["workspace"], ENVIRON["slice"], $0}')
+
 
 def outputSegments(outfile,
                    intervals,
@@ -435,12 +443,18 @@ def genericImportAnnotator(infiles, outfile, table, workspace, slice, subset, fd
     '''generic import of annotator results.
 
     Assumes that the suffix of all infiles is the same.
+
+    The annotator output is annotated with subset, workspace and slice
+    on the fly and piped straight into the database.
     '''
 
     infile = " ".join(infiles)
     x, suffix = os.path.splitext(infiles[0])
 
-    tmpfilename = P.get_temp_filename()
+    awk_environment = " ".join(
+        "%s=%s" % (key, shlex.quote(str(value))) for key, value in
+        (("subset", subset), ("workspace", workspace), ("slice", slice)))
+    awk_program = ANNOTATOR_AWK
 
     statement = '''
     cgat annotator2tsv \
@@ -448,29 +462,16 @@ def genericImportAnnotator(infiles, outfile, table, workspace, slice, subset, fd
     --fdr-method=%(fdr_method)s \
     --log=%(outfile)s.log \
     --regex-identifier="(.*)%(suffix)s" \
-    %(infile)s > %(tmpfilename)s
-    '''
-    P.run(statement)
-
-    tmpfile = P.get_temp_file()
-
-    for line in open(tmpfilename, "r"):
-        if line.startswith("id"):
-            line = "subset\tworkspace\tslice\t" + re.sub("^id", "track", line)
-        else:
-            line = "%s\t%s\t%s\t%s" % (subset, workspace, slice, line)
-        tmpfile.write(line)
-    tmpfile.close()
-    tmpfilename2 = tmpfile.name
-
-    statement = '''
-   cgat csv2db %(csv2db_options)s \
+    %(infile)s
+    | %(awk_environment)s awk -v OFS='\\t' '%(awk_program)s'
+    | cgat csv2db %(csv2db_options)s \
     --table=%(table)s
-    < %(tmpfilename2)s > %(outfile)s'''
+    > %(outfile)s'''
 
-    P.run(**dict(list(locals().items()) + list(P.get_params().items())))
-    os.unlink(tmpfilename)
-    os.unlink(tmpfilename2)
+    # copy and update rather than concatenating two item lists
+    kwargs = dict(locals())
+    kwargs.update(P.get_params())
+    P.run(**kwargs)
 
 
 def importAnnotator(infiles, outfile, regex_id, table,
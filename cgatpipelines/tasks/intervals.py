@@ -1368,8 +1368,10 @@ def loadMACS(infile, outfile, bamfile, controlfile=None):
     else:
         control = ""
 
+    table = P.to_table(outfile)
+
     load_statement = P.build_load_statement(
-        P.to_table(outfile) + "_peaks",
+        table + "_peaks",
         options="--add-index=contig,start "
         "--add-index=interval_id "
         "--allow-empty-file")
@@ -1400,7 +1402,7 @@ def loadMACS(infile, outfile, bamfile, controlfile=None):
             "SummitPosition"))
 
         load_statement = P.build_load_statement(
-            P.to_table(outfile) + "_summits",
+            table + "_summits",
             options="--add-index=contig,start "
             "--add-index=interval_id "
             "--allow-empty-file")
@@ -1427,7 +1429,7 @@ def loadMACS(infile, outfile, bamfile, controlfile=None):
     if os.path.exists(filename_diag):
 
         load_statement = P.build_load_statement(
-            P.to_table(outfile) + "_diagnostics",
+            table + "_diagnostics",
             options="--map=fc:str")
 
         statement = '''
@@ -1568,8 +1570,10 @@ def loadMACS2(infile, outfile, bamfile, controlfile=None):
     else:
         control = ""
 
+    table = P.to_table(outfile)
+
     load_statement = P.build_load_statement(
-        P.to_table(outfile) + "_peaks",
+        table + "_peaks",
         options="--add-index=contig,start "
         "--add-index=interval_id "
         "--allow-empty-file")
@@ -1600,7 +1604,7 @@ def loadMACS2(infile, outfile, bamfile, controlfile=None):
             "SummitPosition"))
 
         load_statement = P.build_load_statement(
-            P.to_table(outfile) + "_summits",
+            table + "_summits",
             options="--add-index=contig,start "
             "--add-index=interval_id "
             "--allow-empty-file")
@@ -1631,7 +1635,7 @@ def loadMACS2(infile, outfile, bamfile, controlfile=None):
             "Height"))
 
         load_statement = P.build_load_statement(
-            P.to_table(outfile) + "_regions",
+            table + "_regions",
             options="--add-index=contig,start "
             "--add-index=interval_id "
             "--allow-empty-file")
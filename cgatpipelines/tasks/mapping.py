@@ -1263,7 +1263,7 @@ class SubsetHead(Mapper):
             f = infiles[0]
             statement.append(
                 '''zcat %(f)s
-                | awk 'NR > %(limit)i {exit} {print}'
+                | head -n %(limit)i
                 | gzip
                 > %(output_filename)s;''' % locals())
         elif len(infiles) > 1:
@@ -1271,7 +1271,7 @@ class SubsetHead(Mapper):
                 output_filename = output_prefix + ".fastq.%i.gz" % x
                 statement.append(
                     '''zcat %(f)s
-                    | awk 'NR > %(limit)i {exit} {print}'
+                    | head -n %(limit)i
                     | gzip
                     > %(output_filename)s''' % locals())
                 if x == len(infiles):
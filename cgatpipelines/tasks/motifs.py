@@ -33,6 +33,7 @@ Code
 '''
 import re
 import os
+import string
 import tempfile
 import collections
 import shutil
@@ -51,6 +52,17 @@ import cgat.Bed as Bed
 # import cgat.Bioprospector as Bioprospector
 import cgat.FastaIterator as FastaIterator
 
+# regular expressions applied per line or per match, compiled once
+RX_MOTIF = re.compile(r"MOTIF\s+(\d+)")
+RX_MAST_MOTIF = re.compile(r":: motif = (\S+) ::")
+RX_MAST_MOTIF_PART = re.compile(r":: motif = (\S+) - (\S+) ::")
+RX_COORDINATES = re.compile(r"(\S+):(\d+)..(\d+)")
+RX_ID_PREFIX = re.compile(r".*_")
+
+# translation table to hard mask soft-masked (lower case) residues
+HARDMASK_TABLE = str.maketrans(string.ascii_lowercase,
+                               "N" * len(string.ascii_lowercase))
+
 
 def filterMotifsFromMEME(infile, outfile, selected):
     '''select motifs from a MEME file and save into outfile
@@ -65,7 +77,7 @@ def filterMotifsFromMEME(infile, outfile, selected):
 
     for line in open(infile, "r"):
         if line.startswith("MOTIF"):
-            motif = re.match("MOTIF\s+(\d+)", line).groups()[0]
+            motif = RX_MOTIF.match(line).groups()[0]
             if motif in selected:
                 keep = True
             else:
@@ -101,7 +113,7 @@ def maskSequences(sequences, masker=None):
         raise ValueError("unknown masker %s" % masker)
 
     # hard mask softmasked characters
-    masked_seq = [re.sub("[a-z]", "N", x) for x in masked_seq]
+    masked_seq = [x.translate(HARDMASK_TABLE) for x in masked_seq]
 
     return masked_seq
 
@@ -410,8 +422,7 @@ def loadGLAM2SCAN(infile, outfile):
         # list of lines
 
         try:
-            motif = re.match(
-                ":: motif = (\S+) ::", lines[chunks[chunk]]).groups()[0]
+            motif = RX_MAST_MOTIF.match(lines[chunks[chunk]]).groups()[0]
         except AttributeError:
             raise ValueError(
                 "parsing error in line '%s'" % lines[chunks[chunk]])
@@ -508,8 +519,8 @@ def loadMAST(infile, outfile):
         # list of lines
         tmpfile2 = P.get_temp_file(".")
         try:
-            motif, part = re.match(
-                ":: motif = (\S+) - (\S+) ::", lines[chunks[chunk]]).groups()
+            motif, part = RX_MAST_MOTIF_PART.match(
+                lines[chunks[chunk]]).groups()
         except AttributeError:
             raise ValueError(
                 "parsing error in line '%s'" % lines[chunks[chunk]])
@@ -557,8 +568,8 @@ def loadMAST(infile, outfile):
             # remove track and pos
             track, match.id = splitId(match.id, "fg")
             # move to genomic coordinates
-            contig, start, end = re.match(
-                "(\S+):(\d+)..(\d+)", match.description).groups()
+            contig, start, end = RX_COORDINATES.match(
+                match.description).groups()
             if match.nmotifs > 0:
                 start, end = int(start), int(end)
                 match.start += start
@@ -676,7 +687,7 @@ def loadBioProspector(infile, outfile):
             arrangement += "%i" % distance
             strand = match.strand[0]
 
-            id = re.sub(".*_", "", match.id)
+            id = RX_ID_PREFIX.sub("", match.id)
             tmpfile.write("%s\t%i\t%i\t%i\t%s\t%s\n" %
                           (id,
                            x,
@@ -1520,10 +1520,9 @@ class Macs2Peakcaller(Peakcaller):
 
             # add a peak identifier and remove header
             statement += '''
-            cat %(filename_broadpeaks)s |
             awk '/Chromosome/ {next; }
             {printf("%%%%s\\t%%%%i\\t%%%%i\\t%%%%i\\t%%%%i\\n",
-            $1,$2,$3,++a,$4)}'
+            $1,$2,$3,++a,$4)}' %(filename_broadpeaks)s
             | cgat bed2table
             --counter=peaks
             --bam-file=%(infile)s
@@ -14,7 +14,6 @@ import re
 import glob
 import collections
 from io import StringIO
-import pandas as pd
 from cgatcore import pipeline as P
 import cgatcore.iotools as iotools
 import cgatcore.csv2db as csv2db
@@ -182,9 +181,14 @@ def buildFastQCSummaryStatus(infiles, outfile, datadir):
         # there can be missing sections
         for fn in glob.glob(filename):
             stats = collections.defaultdict(str)
-            for name, status, header, data in FastqcSectionIterator(
-                    iotools.open_file(fn)):
-                stats[name] = status
+            # only the section headers are needed, so avoid
+            # splitting the data rows as FastqcSectionIterator does.
+            with iotools.open_file(fn) as inf:
+                for line in inf:
+                    if line.startswith(">>") and \
+                       not line.startswith(">>END_MODULE"):
+                        name, status = line[2:-1].split("\t")
+                        stats[name] = status
             track = fastqc_filename2track(fn)
             results.append((track, fn, stats))
             names.update(list(stats.keys()))
@@ -212,31 +216,27 @@ def buildExperimentReadQuality(infiles, outfile, datadir):
         Location of actual Fastqc output to be parsed.
 
     """
+    # pandas is slow to import, so it is only loaded by the
+    # functions that build data frames.
+    import pandas as pd
+
     data = collectFastQCSections(infiles,
                                  "Per sequence quality scores",
                                  datadir)
-    first = True
 
     if len(data) == 0:
         raise ValueError("received no data")
 
+    # align all replicates on quality in a single outer join
+    # instead of merging them pairwise.
+    counts = []
     for track, status, header, rows in data:
         T = track
         rows = [list(map(float, x.split("\t"))) for x in rows]
-        header = header.split("\t")
-        if first:
-            first = False
-            df_out = pd.DataFrame(rows)
-            df_out.columns = header
-            df_out.rename(columns={"Count": track}, inplace=True)
-        else:
-            df = pd.DataFrame(rows)
-            df.columns = header
-            df.rename(columns={"Count": track}, inplace=True)
-            df_out = df_out.merge(df, how="outer", on="Quality", sort=True)
+        df = pd.DataFrame(rows, columns=header.split("\t"))
+        counts.append(df.set_index("Quality")["Count"])
 
-    df_out.set_index("Quality", inplace=True)
-    df_out = pd.DataFrame(df_out.sum(axis=1))
+    df_out = pd.DataFrame(pd.concat(counts, axis=1).sort_index().sum(axis=1))
     df_out.columns = ["_".join(T.split("-")[:-1]), ]
 
     df_out.to_csv(iotools.open_file(outfile, "w"), sep="\t")
@@ -258,6 +258,7 @@ def read_fastqc(infiles):
     -------
     dataframes
     """
+    import pandas as pd
 
     dfs, tracks = collections.defaultdict(list), []
     for infile in infiles:
@@ -290,6 +291,7 @@ def read_fastq_screen(infiles):
     -------
     multiple dataframes
     """
+    import pandas as pd
 
     dfs, tracks, summaries = [], [], []
     for infile in infiles:
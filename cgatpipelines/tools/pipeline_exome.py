@@ -168,7 +168,6 @@ from ruffus.combinatorics import permutations
 import sys
 import os
 import csv
-import glob
 import re
 import shutil
 import decimal
@@ -193,8 +192,10 @@ PARAMS = P.get_parameters(
 INPUT_FORMATS = ("*.fastq.1.gz", "*.fastq.gz", "*.sra", "*.csfasta.gz")
 REGEX_FORMATS = regex(r"(\S+).(fastq.1.gz|fastq.gz|sra|csfasta.gz)")
 
-matches = glob.glob("*.fastq.1.gz") + glob.glob(
-    "*.fastq.gz") + glob.glob("*.sra") + glob.glob("*.csfasta.gz")
+# list the directory once rather than globbing per input format
+INPUT_SUFFIXES = tuple(x[1:] for x in INPUT_FORMATS)
+matches = [x for x in os.listdir(".")
+           if not x.startswith(".") and x.endswith(INPUT_SUFFIXES)]
 
 
 def getGATKOptions():
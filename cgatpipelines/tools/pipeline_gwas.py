@@ -208,7 +208,7 @@ def makeKeepFile(infile, outfile):
     '''
 
     statement = '''
-    cat %(infile)s | awk '{if(NR > 1) {printf("%%s\\t%%s\\n", $1, $2)}}'
+    awk '{if(NR > 1) {printf("%%s\\t%%s\\n", $1, $2)}}' %(infile)s
     > %(outfile)s
     '''
 
@@ -364,8 +364,8 @@ def nameVariants(infiles, outfile):
     # use awk on the .bim file to generate replacement IDs
 
     state0 = '''
-    cat %(bim_file)s | awk '{if($2 == ".") {printf("%%s\\t%%s_%%s_%%s_%%s\\t%%s\\t%%s\\t%%s\\t%%s\\n",
-    $1,$1,$4,$5,$6,$3,$4,$5,$6)} else{print $0}}' > %(temp_file)s.bim;
+    awk '{if($2 == ".") {printf("%%s\\t%%s_%%s_%%s_%%s\\t%%s\\t%%s\\t%%s\\t%%s\\n",
+    $1,$1,$4,$5,$6,$3,$4,$5,$6)} else{print $0}}' %(bim_file)s > %(temp_file)s.bim;
     mv %(temp_file)s.bim %(bim_file)s
     '''
 
@@ -1218,7 +1218,7 @@ def flagRelated(infiles, outfile):
     job_memory = "1G"
     to_cluster = False
     statement = '''
-    cat %(fam_file)s | tr -s ' ' '\\t' | cut -f 1,2
+    tr -s ' ' '\\t' < %(fam_file)s | cut -f 1,2
     | diff %(unrelated)s - | grep ">" | sed 's/>//g'
     > %(outfile)s
     '''
@@ -1764,8 +1764,8 @@ def splitRegionsFile(infile, outfile):
     # I LOVE AWK!!!!
 
     statement = '''
-    cat %(infile)s | awk '{if(NR > 1) {printf("conditional.dir/chr%%i-%%i-%%i_%%s.tsv\\n",
-    $1, $2, $3, $4)}}' | awk '{system("touch " $0)}';
+    awk '{if(NR > 1) {printf("conditional.dir/chr%%i-%%i-%%i_%%s.tsv\\n",
+    $1, $2, $3, $4)}}' %(infile)s | awk '{system("touch " $0)}';
     '''
 
     P.run(statement)
@@ -1993,7 +1993,7 @@ def splitTargetVariants(infile, outfile):
 
     job_memory = "0.5G"
     statement = '''
-    cat %(infile)s | grep -v "END" | awk '{if(NR > 1) {printf("target_snps.dir/%%s.target\\n", $1)}}'
+    grep -v "END" %(infile)s | awk '{if(NR > 1) {printf("target_snps.dir/%%s.target\\n", $1)}}'
     | awk '{system("touch " $0)}';
     '''
 
@@ -2801,8 +2801,8 @@ def subSampleIndividuals(infiles, outfile):
     fam_temp = P.get_temp_filename(shared=True)
 
     statement = '''
-    cat %(keep_file)s | cut -f1,2 | sort | grep -v "FID" > %(keep_temp)s;
-    cat %(fam_file)s | tr " " "\\t" | cut -f1,2 | sort > %(fam_temp)s;
+    cut -f1,2 %(keep_file)s | sort | grep -v "FID" > %(keep_temp)s;
+    tr " " "\\t" < %(fam_file)s | cut -f1,2 | sort > %(fam_temp)s;
     comm -12 %(fam_temp)s %(keep_temp)s | shuf -n %(mlm_subsample)s
     > %(outfile)s;
     rm -rf %(keep_temp)s %(fam_temp)s
@@ -2872,7 +2872,7 @@ def subsetPhenotype(infile, outfile):
     job_memory = "1G"
 
     statement = '''
-    cat %(infile)s | tr " " "\\t" | cut -f 1,2,6 |
+    tr " " "\\t" < %(infile)s | cut -f 1,2,6 |
     awk 'BEGIN {printf("FID\\tIID\\tPHENO\\n")} {print $0}'
     > %(outfile)s'''
 
@@ -3099,8 +3099,8 @@ def selectRefPopulation(infile, outfile):
     job_memory = "1G"
 
     statement = '''
-    cat %(infile)s |
     awk '{if($3 == "%(reference_select)s") {printf("%%s\\t%%s\\n", $1, $1)}}'
+    %(infile)s
     > %(outfile)s
     '''
 
@@ -3399,7 +3399,7 @@ def transformMetalForLocuszoom(infile, outfile):
     '''
 
     statement = '''
-    cat %(infile)s | cut -f 6,7 |
+    cut -f 6,7 %(infile)s |
     awk 'BEGIN {printf("MarkerName\\tP\\n")}
     {if(NR > 1)
     {printf("%%s\\t%%s\\n", $2, $1)}}' |
@@ -3467,7 +3467,7 @@ def makeSnpSets(infile, outfile):
     '''
 
     statement = '''
-    cat %(infile)s | cut -f 7 > %(outfile)s
+    cut -f 7 %(infile)s > %(outfile)s
     '''
 
     P.run(statement)
@@ -3770,9 +3770,8 @@ def selectRegionGenes(infiles, outfile):
     start = resfile.split("/")[-1].split("_")[1]
 
     statement = '''
-    cat %(gene_file)s |
     awk '{if(($2 >= %(start)s - 1500000) && ($3 <= %(start)s + 1500000))
-    {print $0}}' | cut -f 4 | sort | uniq > %(outfile)s
+    {print $0}}' %(gene_file)s | cut -f 4 | sort | uniq > %(outfile)s
     '''
 
     P.run(statement)
@@ -3912,8 +3911,8 @@ def subSampleIndividualsForReml(infiles, outfile):
     fam_temp = P.get_temp_filename(shared=True)
 
     statement = '''
-    cat %(keep_file)s | tr -s " " "\\t" | cut -f1,2 | sort | grep -v "FID" > %(keep_temp)s;
-    cat %(fam_file)s | tr " " "\\t" | cut -f1,2 | sort > %(fam_temp)s;
+    tr -s " " "\\t" < %(keep_file)s | cut -f1,2 | sort | grep -v "FID" > %(keep_temp)s;
+    tr " " "\\t" < %(fam_file)s | cut -f1,2 | sort > %(fam_temp)s;
     comm -12 %(fam_temp)s %(keep_temp)s | shuf -n %(mlm_subsample)s
     > %(outfile)s;
     rm -rf %(keep_temp)s %(fam_temp)s
@@ -4024,7 +4023,7 @@ def subsetRemlPhenotype(infile, outfile):
     job_memory = "1G"
 
     statement = '''
-    cat %(infile)s | tr " " "\\t" | cut -f1,2,6
+    tr " " "\\t" < %(infile)s | cut -f1,2,6
     > %(outfile)s
     '''
 
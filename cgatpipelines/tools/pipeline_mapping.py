@@ -2114,7 +2114,7 @@ def buildBigWig(infile, outfile):
         -split
         -scale %(scale)f
         > %(tmpfile)s &&
-        cat %(tmpfile)s | LC_COLLATE=C sort -k1,1 -k2,2n > %(tmpfile2)s &&
+        LC_COLLATE=C sort -k1,1 -k2,2n %(tmpfile)s > %(tmpfile2)s &&
         bedGraphToBigWig %(tmpfile2)s %(contig_sizes)s %(outfile)s &&
         rm -f %(tmpfile)s %(tmpfile2)s
         '''
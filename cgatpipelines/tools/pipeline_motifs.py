@@ -468,13 +468,24 @@ def loadMemeSummary(infiles, outfile):
     os.unlink(outf.name)
 
 
+def getDiscoveryOptions():
+    '''return lists of peak numbers, widths and maskers for
+    motif discovery.
+
+    Values are converted to strings as they are used to build
+    filenames. Empty entries are ignored.
+    '''
+    return [[x for x in (y.strip() for y in str(PARAMS[key]).split(",")) if x]
+            for key in ("memechip_npeaks",
+                        "memechip_widths",
+                        "memechip_maskers")]
+
+
 def suggestMotifDiscoveryForeground():
     '''output bed files for motif discovery.
     '''
 
-    npeaks = [x.strip() for x in str(PARAMS["memechip_npeaks"]).split(",")]
-    widths = [x.strip() for x in str(PARAMS["memechip_widths"]).split(",")]
-    maskers = [x.strip() for x in str(PARAMS["memechip_maskers"]).split(",")]
+    npeaks, widths, maskers = getDiscoveryOptions()
 
     for infile in TRACKS_BEDFILES:
         track = P.snip(os.path.basename(infile), ".bed.gz")
@@ -493,9 +504,7 @@ def suggestMotifDiscoveryBackground():
     '''output bed files for motif discovery.
     '''
 
-    npeaks = [x.strip() for x in str(PARAMS["memechip_npeaks"]).split(",")]
-    widths = [x.strip() for x in str(PARAMS["memechip_widths"]).split(",")]
-    maskers = [x.strip() for x in str(PARAMS["memechip_maskers"]).split(",")]
+    npeaks, widths, maskers = getDiscoveryOptions()
 
     for infile in TRACKS_BEDFILES:
         track = P.snip(os.path.basename(infile), ".bed.gz")
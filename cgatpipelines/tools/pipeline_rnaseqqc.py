@@ -1227,8 +1227,9 @@ def characteriseTranscripts(infile, outfile):
     ''' obtain attributes for transcripts '''
 
     statement = '''
-    cat %(infile)s | cgat fasta2table
+    cgat fasta2table
     --split-fasta-identifier --section na dn length -L %(outfile)s.log
+    < %(infile)s
     | gzip > %(outfile)s'''
 
     P.run(statement)
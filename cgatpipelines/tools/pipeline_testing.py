@@ -150,7 +150,7 @@ Code
 """
 from ruffus import files, transform, suffix, follows, merge, collate, regex, mkdir, jobs_limit
 import sys
-import pipes
+import shlex
 import os
 import re
 import glob
@@ -327,7 +327,7 @@ def compute_file_metrics(infile, outfile, metric, suffixes):
     # convert regex patterns to a suffix match:
     # prepend a .*
     # append a $
-    regex_pattern = " -or ".join(["-regex .*{}$".format(pipes.quote(x))
+    regex_pattern = " -or ".join(["-regex .*{}$".format(shlex.quote(x))
                                   for x in suffixes])
 
     E.debug("applying metric {} to files matching {}".format(metric,
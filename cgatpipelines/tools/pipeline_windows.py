@@ -1351,8 +1351,7 @@ def normalizeBed(infile, outfile):
              to_cluster=True,
              job_options="-l mem_free=32G")
 
-    statement = '''cat %(tmpfile)s |
-                   gzip > %(outfile)s; rm -f %(tmpfile)s'''
+    statement = '''gzip < %(tmpfile)s > %(outfile)s; rm -f %(tmpfile)s'''
 
     P.run(statement)
 
@@ -1388,7 +1387,7 @@ def enrichVsInput(infile, outfile):
              outfiles=tmpfile,
              to_cluster=True)
 
-    statement = '''cat %(tmpfile)s |  gzip > %(outfile)s; rm -f %(tmpfile)s'''
+    statement = '''gzip < %(tmpfile)s > %(outfile)s; rm -f %(tmpfile)s'''
 
     P.run(statement)
 
@@ -63,17 +63,17 @@ def main(argv=None):
     # add common options (-h/--help, ...) and parse command line
     (options, args) = E.Start(parser, argv=argv)
 
-    statement = "find %s -name 'index.html'" % options.path
+    statement = ["find", options.path, "-name", "index.html"]
 
     process = subprocess.Popen(statement,
-                               shell=True,
                                stdin=subprocess.PIPE,
                                stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE)
+                               stderr=subprocess.PIPE,
+                               universal_newlines=True)
 
     stdout, stderr = process.communicate()
 
-    files = stdout.split('\n')
+    files = stdout.splitlines()
     files.sort()
 
     outfile = iotools.openFile(os.path.join(options.dest, "index.html"), "w")
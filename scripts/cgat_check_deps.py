@@ -46,6 +46,7 @@ import re
 import ast
 import argparse
 import bashlex
+from multiprocessing.pool import ThreadPool
 
 
 # inspired by
@@ -297,13 +298,17 @@ def checkDepedencies(pipeline):
                 else:
                     deps[command] += 1
 
-    # list of unmet dependencies
+    # list of unmet dependencies, ordered by number of calls.
+    # PATH lookups are dominated by stat calls, so overlap them
+    # in a small thread pool.
+    programs = sorted(deps, key=deps.get, reverse=True)
     check_path_failures = []
-
-    # print dictionary ordered by value
-    for k in sorted(deps, key=deps.get, reverse=True):
-        if shutil.which(k) is None:
-            check_path_failures.append(k)
+    if programs:
+        pool = ThreadPool(min(len(programs), 8))
+        locations = pool.map(shutil.which, programs)
+        pool.close()
+        check_path_failures = [k for k, location in zip(programs, locations)
+                               if location is None]
 
     return deps, check_path_failures
 
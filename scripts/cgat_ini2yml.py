@@ -8,6 +8,10 @@ import sys
 import re
 import cgatcore.experiment as E
 
+# compiled once, applied to every line of the .ini file
+RX_SECTION = re.compile(r"\[(.*)\]")
+RX_KEY_VALUE = re.compile(r"([^=]+)=(.*)")
+
 
 def main(argv=None):
     """script main.
@@ -30,7 +34,8 @@ def main(argv=None):
     # add common options (-h/--help, ...) and parse command line
     (options, args) = E.start(parser, argv=argv)
 
-    indent = 0
+    # indentation prefix, computed once per section rather than per key
+    prefix = ""
     for line in options.stdin:
 
         if not line.strip():
@@ -38,19 +43,19 @@ def main(argv=None):
             continue
 
         if line.startswith("["):
-            section = re.search("\[(.*)\]", line).groups()[0]
+            section = RX_SECTION.search(line).groups()[0]
             if section == "general":
-                indent = 0
+                prefix = ""
                 options.stdout.write("\n")
             else:
-                indent = 4
+                prefix = " " * 4
                 options.stdout.write("{}:\n".format(line.strip()[1:-1]))
 
         elif line.startswith("#"):
-            options.stdout.write("{}{}".format(" " * indent, line))
+            options.stdout.write(prefix + line)
 
         elif "=" in line:
-            key, val = re.search("([^=]+)=(.*)", line).groups()
+            key, val = RX_KEY_VALUE.search(line).groups()
             key = key.strip()
             val = val.strip()
 
@@ -58,7 +63,7 @@ def main(argv=None):
                 val = "[{}]".format(val)
 
             if "!?" in val:
-                val = re.sub("!?", "?!", val)
+                val = val.replace("!?", "?!")
 
             if val is None:
                 val = ''
@@ -66,7 +71,7 @@ def main(argv=None):
             if val == "":
                 val = "''"
 
-            options.stdout.write("{}{}: {}\n".format(" " * indent, key, val))
+            options.stdout.write(prefix + key + ": " + val + "\n")
     # write footer and output benchmark information.
     E.stop()
 
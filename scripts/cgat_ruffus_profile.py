@@ -108,6 +108,22 @@ import collections
 import cgatcore.experiment as E
 import cgatcore.iotools as iotools
 
+RX_TIMESTAMP = re.compile(r"^[0-9]+")
+
+# ruffus log messages (with whitespace removed) and the event they
+# denote. The first matching pattern wins.
+RX_EVENTS = (
+    (re.compile(r"task.log_at_level.\d+Task=(\S+)"), None),
+    (re.compile(r"Job=\[(\S+)->(\S+)\]Missingfile[s]*\[(\S+)\]"),
+     "started_job"),
+    (re.compile(r"Job=\[(\S+)->(\S+)\]Missingfile[s]*"), "started_job"),
+    # multi-line log messages
+    (re.compile(r"Job=\[(\S+)->(\S+)\]\s*\.\.\."), "started_job"),
+    (re.compile(r"Taskentersqueue=(\S+)"), "started_task"),
+    (re.compile(r"Job=\[(\S+)->(\S+)\]completed"), "completed_job"),
+    (re.compile(r"CompletedTask=(\S+)"), "completed_task"),
+    (re.compile(r"UptodateTask=(\S+)"), "completed_task"))
+
 
 class Counter(object):
 
@@ -202,8 +218,6 @@ def main(argv=sys.argv):
 
     (options, args) = E.Start(parser, argv)
 
-    rx = re.compile("^[0-9]+")
-
     if options.sections:
         profile_sections = options.sections
     else:
@@ -218,21 +232,21 @@ def main(argv=sys.argv):
     infile = iotools.openFile(options.logfile)
 
     for line in infile:
-        if not rx.match(line):
+        if not RX_TIMESTAMP.match(line):
             continue
         data = line[:-1].split()
         if len(data) < 5:
             continue
         date, time, level, source = data[:4]
 
-        if re.search("output generated by", line):
+        if "output generated by" in line:
             if options.reset:
                 E.info("resetting counts at line=%s" % line[:-1])
                 for section in profile_sections:
                     counts[section] = collections.defaultdict(Counter)
             continue
 
-        if not re.match("task\.", source):
+        if not source.startswith("task."):
             continue
 
         dt = datetime.datetime.strptime(
@@ -243,31 +257,22 @@ def main(argv=sys.argv):
         started_task, completed_task, started_job, completed_job = \
             (None, None, None, None)
 
-        if re.search("task.log_at_level.\d+Task=(\S+)", msg):
-            checked_task = re.search(
-                "task.log_at_level.\d+Task=(\S+)", msg).groups()[0]
-        elif re.search("Job=\[(\S+)->(\S+)\]Missingfile[s]*\[(\S+)\]", msg):
-            started_infiles, started_job, missing = re.search(
-                "Job=\[(\S+)->(\S+)\]Missingfile[s]*\[(\S+)\]", msg).groups()
-        elif re.search("Job=\[(\S+)->(\S+)\]Missingfile[s]*", msg):
-            started_infiles, started_job = re.search(
-                "Job=\[(\S+)->(\S+)\]Missingfile[s]*", msg).groups()
-        elif re.search("Job=\[(\S+)->(\S+)\]\s*\.\.\.", msg):
-            # multi-line log messages
-            started_infiles, started_job = re.search(
-                "Job=\[(\S+)->(\S+)\]\s*\.\.\.", msg).groups()
-        elif re.search("Taskentersqueue=(\S+)", msg):
-            started_task = re.search("Taskentersqueue=(\S+)", msg).groups()[0]
-        elif re.search("Job=\[(\S+)->(\S+)\]completed", msg):
-            completed_infiles, completed_job = re.search(
-                "Job=\[(\S+)->(\S+)\]completed", msg).groups()
-        elif re.search("CompletedTask=(\S+)", msg):
-            completed_task = re.search("CompletedTask=(\S+)", msg).groups()[0]
-        elif re.search("UptodateTask=(\S+)", msg):
-            completed_task = re.search("UptodateTask=(\S+)", msg).groups()[0]
+        for rx, event in RX_EVENTS:
+            match = rx.search(msg)
+            if match:
+                break
         else:
             continue
 
+        if event == "started_task":
+            started_task = match.group(1)
+        elif event == "completed_task":
+            completed_task = match.group(1)
+        elif event == "started_job":
+            started_job = match.group(2)
+        elif event == "completed_job":
+            completed_job = match.group(2)
+
         try:
             if started_task:
                 counts["task"][started_task].add(True, dt, started_task)
@@ -35,6 +35,7 @@ Command line options
 
 import sys
 import os
+import operator
 import cgatcore.experiment as E
 
 
@@ -73,6 +74,8 @@ def main(argv=None):
               'st_mode', 'st_mtime', 'st_nlink',
               'st_rdev', 'st_size', 'st_uid')
 
+    get_fields = operator.attrgetter(*fields)
+
     outfile.write("filename\tlinkdest\t%s\n" % "\t".join(fields))
 
     # remove any duplicates and sort
@@ -102,7 +105,7 @@ def main(argv=None):
         outfile.write("%s\t%s\t%s\n" % (
             fn,
             linkdest,
-            "\t".join([str(getattr(original, x)) for x in fields])))
+            "\t".join(map(str, get_fields(original)))))
 
         if not options.dry_run:
             # Set original times
@@ -82,15 +82,10 @@ from multiprocessing.pool import Pool, ThreadPool
 
 import cgatcore.experiment as E
 import cgatcore.iotools as iotools
-import cgat.Blat as Blat
 
 from cgatcore.pipeline import Cluster as Cluster
 
-try:
-    import drmaa
-    HAS_DRMAA = True
-except (ImportError, RuntimeError):
-    HAS_DRMAA = False
+RX_TABS = re.compile("\t+")
 
 
 def chunk_iterator_lines(infile, args, prefix, use_header=False):
@@ -262,6 +257,9 @@ def chunk_iterator_regex_split(infile, args, prefix, use_header=False):
 def chunk_iterator_psl_overlap(infile, args, prefix, use_header=False):
     """iterate over overlapping entries in a psl file."""
 
+    # only needed for psl input, imported here to keep start-up light
+    import cgat.Blat as Blat
+
     iterator = Blat.BlatIterator(sys.stdin)
 
     processed_contigs = set()
@@ -545,7 +543,7 @@ def runCommand(data):
     if subdirs:
         outdir = "%s.dir/" % (filename)
         os.mkdir(outdir)
-        cmd = re.sub("%DIR%", outdir, cmd)
+        cmd = cmd.replace("%DIR%", outdir)
 
     x = re.search("'--log=(\S+)'", cmd) or re.search("'--L\s+(\S+)'", cmd)
     if x:
@@ -636,6 +634,10 @@ def hasFinished(retcode, filename, output_tag, logfile):
 def runDRMAA(data, environment):
     '''run jobs in data using drmaa to connect to the cluster.'''
 
+    # loading the drmaa library is expensive, only do so when
+    # jobs are actually sent to the cluster.
+    import drmaa
+
     # SNS: Error dection now taken care of with Cluster.py
     # expandStatement function
 
@@ -648,6 +650,7 @@ def runDRMAA(data, environment):
 
     jobids = []
     kwargs = {}
+    jt = None
 
     for filename, cmd, options, tmpdir, subdirs in data:
 
@@ -656,7 +659,7 @@ def runDRMAA(data, environment):
         if subdirs:
             outdir = "%s.dir/" % (filename)
             os.mkdir(outdir)
-            cmd = re.sub("%DIR%", outdir, cmd)
+            cmd = cmd.replace("%DIR%", outdir)
 
         x = re.search("'--log=(\S+)'", cmd) or re.search("'--L\s+(\S+)'", cmd)
         if x:
@@ -666,14 +669,14 @@ def runDRMAA(data, environment):
             logfile = filename + ".out"
 
         if "%STDIN%" in cmd:
-            cmd = re.sub("%STDIN%", filename, cmd)
+            cmd = cmd.replace("%STDIN%", filename)
             from_stdin = False
 
         if "%STDOUT%" in cmd:
-            cmd = re.sub("%STDOUT%", filename + ".out", cmd)
+            cmd = cmd.replace("%STDOUT%", filename + ".out")
             to_stdout = False
 
-        cmd = " ".join(re.sub("\t+", " ", cmd).split("\n"))
+        cmd = " ".join(RX_TABS.sub(" ", cmd).split("\n"))
         E.info("running statement:\n%s" % cmd)
 
         job_script = tempfile.NamedTemporaryFile(dir=os.getcwd(), delete=False, mode="w+t")
@@ -687,34 +690,37 @@ def runDRMAA(data, environment):
 
         # get session for process - only one is permitted
 
-        job_name = os.path.basename(kwargs.get("outfile", "farm.py"))
+        # all chunks share the same options, so the job template
+        # (native specification and environment) is only built once.
+        if jt is None:
+            job_name = os.path.basename(kwargs.get("outfile", "farm.py"))
 
-        options_dict = vars(options)
-        options_dict["workingdir"] = os.getcwd()
+            options_dict = vars(options)
+            options_dict["workingdir"] = os.getcwd()
 
-        if options.job_memory:
-            job_memory = options.job_memory
-        elif options.cluster_memory_default:
-            job_memory = options.cluster_memory_default
-        else:
-            job_memory = "2G"
-
-        jt = Cluster.setupDrmaaJobTemplate(session, options_dict,
-                                           job_name, job_memory)
+            if options.job_memory:
+                job_memory = options.job_memory
+            elif options.cluster_memory_default:
+                job_memory = options.cluster_memory_default
+            else:
+                job_memory = "2G"
+
+            jt = Cluster.setupDrmaaJobTemplate(session, options_dict,
+                                               job_name, job_memory)
+
+            # update the environment
+            e = {'BASH_ENV': options.bashrc}
+            if environment:
+                for en in environment:
+                    try:
+                        e[en] = os.environ[en]
+                    except KeyError:
+                        raise KeyError(
+                            "could not export environment variable '%s'" % en)
+            jt.jobEnvironment = e
 
         jt.remoteCommand = job_path
 
-        # update the environment
-        e = {'BASH_ENV': options.bashrc}
-        if environment:
-            for en in environment:
-                try:
-                    e[en] = os.environ[en]
-                except KeyError:
-                    raise KeyError(
-                        "could not export environment variable '%s'" % en)
-        jt.jobEnvironment = e
-
         # SNS: Native specifation setting abstracted
         # to Pipeline/Cluster.setupDrmaaJobTemplate()
 
@@ -748,7 +754,7 @@ def runDRMAA(data, environment):
             # ignore message 24 in PBS
             # code 24: drmaa: Job finished but resource usage information
             # and/or termination status could not be provided.":
-            if not msg.message.startswith("code 24"):
+            if not str(msg).startswith("code 24"):
                 raise
             retval = None
 
@@ -760,7 +766,8 @@ def runDRMAA(data, environment):
 
         os.unlink(job_path)
 
-    session.deleteJobTemplate(jt)
+    if jt is not None:
+        session.deleteJobTemplate(jt)
     session.exit()
 
 
@@ -969,7 +976,7 @@ def main(argv=None):
 
     if options.dry_run:
 
-        cmd = re.sub("%DIR%", "", cmd)
+        cmd = cmd.replace("%DIR%", "")
         retcode = subprocess.call(cmd,
                                   shell=True,
                                   stdin=sys.stdin,
@@ -92,7 +92,7 @@ def main(argv=None):
     try:
         function = getattr(module, options.function)
     except AttributeError as msg:
-        raise AttributeError(msg.message + "unknown function, available functions are: %s" %
+        raise AttributeError(str(msg) + "unknown function, available functions are: %s" %
                              ",".join([x for x in dir(module) if not x.startswith("_")]))
 
     if options.input_filenames and not options.input_filenames == ["None"]:
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import unittest
+import cgatpipelines.tasks.enrichment as Enrichment
+
+
+class TestAnnotatorAwk(unittest.TestCase):
+
+    def run_awk(self, text, **environment):
+        env = os.environ.copy()
+        env.update(environment)
+        return subprocess.check_output(
+            ["awk", "-v", "OFS=\t", Enrichment.ANNOTATOR_AWK],
+            input=text, env=env, universal_newlines=True)
+
+    def test_header_and_rows_are_prefixed(self):
+        result = self.run_awk(
+            "id\tfdr\tpvalue\na\t0.1\t0.01\n",
+            subset="all", workspace="genome", slice="full")
+
+        self.assertEqual(
+            result,
+            "subset\tworkspace\tslice\ttrack\tfdr\tpvalue\n"
+            "all\tgenome\tfull\ta\t0.1\t0.01\n")
+
+    def test_values_are_output_verbatim(self):
+        result = self.run_awk(
+            "id\tfdr\na\t0.1\n",
+            subset="a b;c", workspace="C:\\tmp", slice="x'y")
+
+        self.assertEqual(
+            result,
+            "subset\tworkspace\tslice\ttrack\tfdr\n"
+            "a b;c\tC:\\tmp\tx'y\ta\t0.1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()